@@ -1,3 +1,4 @@
+import os
 import re
 from sys import version_info
 
@@ -16,6 +17,18 @@ else:
     js2py_version = 'js2py'
 
 
+# Opt-in: compile the pure-Python parsing helpers with Cython.
+# The .py sources are still shipped, so the package works without the build.
+ext_modules = []
+if os.environ.get('TWIKIT_CYTHONIZE'):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ['twikit/utils.py', 'twikit/tweet.py', 'twikit/user.py'],
+        language_level=3
+    )
+
+
 setup(
     name='twikit',
     version=version,
@@ -29,11 +42,17 @@ setup(
         'm3u8',
         js2py_version
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'brotli': ['httpx[brotli]'],
+        'orjson': ['orjson']
+    },
     python_requires='>=3.8',
     description='Twitter API wrapper for python with **no API key required**.',
     long_description=long_description,
     long_description_content_type='text/markdown',
     license='MIT',
     url='https://github.com/d60/twikit',
-    package_data={'twikit': ['py.typed']}
+    package_data={'twikit': ['py.typed']},
+    ext_modules=ext_modules
 )
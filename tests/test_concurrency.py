@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+
+from twikit import Client
+from twikit.errors import BadRequest
+
+SEGMENT_SIZE = 8 * 1024 * 1024
+
+
+class InFlight:
+    """Counts how many calls are running at the same time."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def __aenter__(self):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    async def __aexit__(self, *exc):
+        self.current -= 1
+
+
+def make_client(handler) -> Client:
+    client = Client('en-US')
+    # Skip the home page fetch used to build X-Client-Transaction-Id.
+    client.client_transaction.home_page_response = True
+    client.client_transaction.generate_transaction_id = lambda **kwargs: 'tid'
+    client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_gather_limited_bounds_concurrency_and_keeps_order():
+    in_flight = InFlight()
+
+    async def f(arg):
+        async with in_flight:
+            # Later arguments finish first.
+            await asyncio.sleep(0.01 * (10 - arg))
+            return arg * 2
+
+    results = asyncio.run(Client._gather_limited(f, list(range(10)), 3))
+
+    assert results == [arg * 2 for arg in range(10)]
+    assert in_flight.peak == 3
+
+
+def test_gather_limited_propagates_errors():
+    async def f(arg):
+        await asyncio.sleep(0)
+        if arg == 2:
+            raise ValueError(arg)
+        return arg
+
+    with pytest.raises(ValueError):
+        asyncio.run(Client._gather_limited(f, list(range(5)), 2))
+
+    results = asyncio.run(
+        Client._gather_limited(f, list(range(5)), 2, return_exceptions=True)
+    )
+    assert results[:2] == [0, 1] and results[3:] == [3, 4]
+    assert isinstance(results[2], ValueError)
+
+
+def test_favorite_tweets_over_mock_transport():
+    in_flight = InFlight()
+    favorited = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async with in_flight:
+            await asyncio.sleep(0.01)
+        favorited.append(request.content)
+        return httpx.Response(200, json={'data': {'favorite_tweet': 'Done'}})
+
+    client = make_client(handler)
+    responses = asyncio.run(
+        client.favorite_tweets([str(i) for i in range(8)], 2)
+    )
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert len(favorited) == 8
+    assert in_flight.peak == 2
+
+
+def upload_handler(in_flight: InFlight, commands: list, fail_segment=None):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        command = request.url.params['command']
+        commands.append(command)
+        if command == 'INIT':
+            return httpx.Response(200, json={'media_id': '1'})
+        if command == 'APPEND':
+            segment_index = int(request.url.params['segment_index'])
+            async with in_flight:
+                if segment_index == fail_segment:
+                    return httpx.Response(400, text='bad segment')
+                await asyncio.sleep(0.05)
+            commands.append('APPENDED')
+            return httpx.Response(204)
+        return httpx.Response(200, json={'media_id': '1'})
+    return handler
+
+
+def test_upload_media_bounds_concurrent_appends():
+    in_flight = InFlight()
+    commands = []
+    client = make_client(upload_handler(in_flight, commands))
+    source = b'\0' * (SEGMENT_SIZE * 6 + 1)
+
+    media_id = asyncio.run(client.upload_media(source, media_type='video/mp4'))
+
+    assert media_id == '1'
+    assert commands.count('APPENDED') == 7
+    assert commands[-1] == 'FINALIZE'
+    assert in_flight.peak == 4
+
+
+def test_upload_media_cancels_appends_on_failure():
+    in_flight = InFlight()
+    commands = []
+    client = make_client(upload_handler(in_flight, commands, fail_segment=1))
+    source = b'\0' * (SEGMENT_SIZE * 6 + 1)
+
+    async def run():
+        with pytest.raises(BadRequest):
+            await client.upload_media(source, media_type='video/mp4')
+        # Every APPEND task has been reaped before the error is raised.
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
+    assert 'FINALIZE' not in commands
+    # Segment 1 failed immediately, so the in-flight segments were cancelled
+    # and the remaining ones were never sent.
+    assert commands.count('APPEND') < 7
+    assert commands.count('APPENDED') == 0
+    assert in_flight.current == 0
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import re
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, NamedTuple
 
+import httpx
 from bs4 import BeautifulSoup
 from httpx import Response
+from .. import _json
 from ..constants import DOMAIN
 
 if TYPE_CHECKING:
     from ..client.client import Client
 
 
+BROTLI_AVAILABLE = (
+    find_spec('brotli') is not None or find_spec('brotlicffi') is not None
+)
+ACCEPT_ENCODING = 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+
 class UnlockHTML(NamedTuple):
     authenticity_token: str
     assignment_token: str
@@ -21,12 +32,74 @@ class UnlockHTML(NamedTuple):
     blob: str
 
 
-class CaptchaSolver:
+class CaptchaSolver(ABC):
     client: Client
     max_attempts: int
 
     CAPTCHA_URL = f'https://{DOMAIN}/account/access'
     CAPTCHA_SITE_KEY = '0152B4EB-D2DC-460A-89A1-629838B529C9'
+    API_URL: str
+
+    _http_client: httpx.AsyncClient | None = None
+    _http_client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns this solver's HTTP client. The client is created lazily
+        and recreated when used from a different event loop, since its
+        connections belong to the loop it was first used on.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_client
+        if (
+            client is None or client.is_closed
+            or self._http_client_loop is not loop
+        ):
+            client = httpx.AsyncClient(
+                headers={
+                    'content-type': 'application/json',
+                    'accept-encoding': ACCEPT_ENCODING
+                },
+                http2=self.client._transport_options['http2'],
+                limits=httpx.Limits(
+                    max_keepalive_connections=16,
+                    max_connections=32,
+                    keepalive_expiry=60
+                ),
+                timeout=30
+            )
+            self._http_client = client
+            self._http_client_loop = loop
+        return client
+
+    async def _post_json(self, path: str, data: dict) -> dict:
+        response = await self._get_http_client().post(
+            self.API_URL + path, content=_json.dumpb(data)
+        )
+        return _json.loads(response.content)
+
+    async def close(self) -> None:
+        """
+        Closes this solver's HTTP client.
+        It is recreated automatically on the next request.
+        """
+        client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    @abstractmethod
+    async def create_task(self, task_data: dict) -> dict:
+        ...
+
+    @abstractmethod
+    async def get_task_result(self, task_id: str) -> dict:
+        ...
+
+    @abstractmethod
+    async def solve_funcaptcha(self, blob: str) -> dict:
+        ...
 
     async def get_unlock_html(self) -> tuple[Response, UnlockHTML]:
         headers = {
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from time import sleep
-
-import httpx
+import asyncio
+import random
+import time
 
+from .. import _json
 from .base import CaptchaSolver
 
 
@@ -31,65 +32,97 @@ class Capsolver(CaptchaSolver):
     max_attempts : :class:`int`, default=3
         The maximum number of attempts to solve the captcha.
     get_result_interval : :class:`float`, default=1.0
-
+        The base interval (in seconds) between task result checks.
+        The interval doubles after every check, with full jitter applied.
+        The first check is delayed based on the average solve time of
+        previous captchas instead.
     use_blob_data : :class:`bool`, default=False
+    max_interval : :class:`float`, default=10.0
+        The upper bound (in seconds) of the interval between task
+        result checks.
+    max_get_result_attempts : :class:`int`, default=30
+        The maximum number of task result checks per captcha. If the
+        task is still not ready, the attempt is treated as failed.
     """
 
+    API_URL = 'https://api.capsolver.com'
+
     def __init__(
         self,
         api_key: str,
         max_attempts: int = 3,
         get_result_interval: float = 1.0,
-        use_blob_data: bool = False
+        use_blob_data: bool = False,
+        max_interval: float = 10.0,
+        max_get_result_attempts: int = 30
     ) -> None:
         self.api_key = api_key
         self.get_result_interval = get_result_interval
+        self.max_interval = max_interval
+        self.max_get_result_attempts = max_get_result_attempts
         self.max_attempts = max_attempts
         self.use_blob_data = use_blob_data
+        self._task_template = {
+            'websiteURL': 'https://iframe.arkoselabs.com',
+            'websitePublicKey': self.CAPTCHA_SITE_KEY,
+            'funcaptchaApiJSSubdomain': 'https://client-api.arkoselabs.com'
+        }
+        # Exponential moving average of the solve time in milliseconds.
+        self._ewma_ms = 8000.0
 
-    def create_task(self, task_data: dict) -> dict:
+    async def create_task(self, task_data: dict) -> dict:
         data = {
             'clientKey': self.api_key,
             'task': task_data
         }
-        response = httpx.post(
-            'https://api.capsolver.com/createTask',
-            json=data,
-            headers={'content-type': 'application/json'}
-        ).json()
-        return response
+        return await self._post_json('/createTask', data)
 
-    def get_task_result(self, task_id: str) -> dict:
+    async def get_task_result(self, task_id: str) -> dict:
         data = {
             'clientKey': self.api_key,
             'taskId': task_id
         }
-        response = httpx.post(
-            'https://api.capsolver.com/getTaskResult',
-            json=data,
-            headers={'content-type': 'application/json'}
-        ).json()
-        return response
+        return await self._post_json('/getTaskResult', data)
 
-    def solve_funcaptcha(self, blob: str) -> dict:
-        if self.client.proxy is None:
+    async def solve_funcaptcha(self, blob: str) -> dict:
+        proxy = self.client.proxy
+        if proxy is None:
             captcha_type = 'FunCaptchaTaskProxyLess'
         else:
             captcha_type = 'FunCaptchaTask'
 
         task_data = {
+            **self._task_template,
             'type': captcha_type,
-            'websiteURL': 'https://iframe.arkoselabs.com',
-            'websitePublicKey': self.CAPTCHA_SITE_KEY,
-            'funcaptchaApiJSSubdomain': 'https://client-api.arkoselabs.com',
-            'proxy': self.client.proxy
+            'proxy': proxy
         }
         if self.use_blob_data:
-            task_data['data'] = '{"blob":"%s"}' % blob
+            task_data['data'] = _json.dumps({'blob': blob})
             task_data['userAgent'] = self.client._user_agent
-        task = self.create_task(task_data)
-        while True:
-            sleep(self.get_result_interval)
-            result = self.get_task_result(task['taskId'])
-            if result['status'] in ('ready', 'failed'):
+        task = await self.create_task(task_data)
+        started_at = time.monotonic()
+        for attempt in range(self.max_get_result_attempts):
+            if attempt == 0:
+                delay = max(0.5, 0.8 * self._ewma_ms / 1000)
+            else:
+                interval = min(
+                    self.max_interval,
+                    self.get_result_interval * 2 ** (attempt - 1)
+                )
+                delay = random.uniform(0, interval)
+            await asyncio.sleep(delay)
+            result = await self.get_task_result(task['taskId'])
+            if result['status'] == 'ready':
+                elapsed_ms = (time.monotonic() - started_at) * 1000
+                self._ewma_ms = 0.8 * self._ewma_ms + 0.2 * elapsed_ms
                 return result
+            if result['status'] == 'failed':
+                return result
+        return {
+            'errorId': 1,
+            'status': 'failed',
+            'errorDescription': (
+                'Task result was not ready after '
+                f'{self.max_get_result_attempts} checks.'
+            )
+        }
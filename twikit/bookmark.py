@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,6 +22,8 @@ class BookmarkFolder:
     media : :class:`str`
         Icon image data.
     """
+    __slots__ = ('_client', 'id', 'name', 'media')
+
     def __init__(self, client: Client, data: dict) -> None:
         self._client = client
 
@@ -54,11 +57,37 @@ class BookmarkFolder:
         """
         return await self._client.bookmark_tweet(tweet_id, self.id)
 
+    async def add_many(
+        self, tweet_ids: list[str], max_concurrency: int = 8
+    ) -> list[Response]:
+        """
+        Adds multiple tweets to the folder concurrently.
+
+        Parameters
+        ----------
+        tweet_ids : list[:class:`str`]
+            The IDs of the tweets to add.
+        max_concurrency : :class:`int`, default=8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list[:class:`httpx.Response`]
+            Responses in the same order as `tweet_ids`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def add(tweet_id: str) -> Response:
+            async with semaphore:
+                return await self.add(tweet_id)
+
+        return await asyncio.gather(*(add(i) for i in tweet_ids))
+
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, BookmarkFolder) and self.id == __value.id
 
-    def __ne__(self, __value: object) -> bool:
-        return not self == __value
+    def __hash__(self) -> int:
+        return hash(self.id)
 
     def __repr__(self) -> str:
         return f'<BookmarkFolder id="{self.id}">'
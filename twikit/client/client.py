@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import io
-import json
 import os
 
 import warnings
@@ -15,10 +14,11 @@ import pyotp
 from httpx import AsyncClient, AsyncHTTPTransport, Response
 from httpx._utils import URLPattern
 
+from .. import _json
 from .._captcha import Capsolver
 from ..bookmark import BookmarkFolder
 from ..community import Community, CommunityMember
-from ..constants import TOKEN, DOMAIN
+from ..constants import DOMAIN, LOGIN_SUBTASK_VERSIONS, TOKEN
 from ..errors import (
     AccountLocked,
     AccountSuspended,
@@ -44,16 +44,19 @@ from ..message import Message
 from ..notification import Notification
 from ..streaming import Payload, StreamingSession, _payload_from_data
 from ..trend import Location, PlaceTrend, PlaceTrends, Trend
-from ..tweet import CommunityNote, Poll, ScheduledTweet, Tweet, tweet_from_data
+from ..tweet import CommunityNote, Poll, ScheduledTweet, Tweet, _tweet_result_from_entry, tweet_from_data
 from ..ui_metrics import solve_ui_metrics
-from ..user import User
+from ..user import User, _user_result_from_entry
 from ..utils import (
+    DEFAULT_LIMITS,
     Flow,
     Result,
     build_tweet_data,
     build_user_data,
     find_dict,
+    find_entries,
     find_entry_by_type,
+    find_first,
     httpx_transport_to_url
 )
 from ..x_client_transaction.utils import handle_x_migration
@@ -61,6 +64,34 @@ from ..x_client_transaction import ClientTransaction
 from .gql import GQLClient
 from .v11 import V11Client
 
+# Names of the GQLClient/V11Client methods behind each `tweet_type` of
+# get_user_tweets and each `type` of get_notifications.
+USER_TWEETS_FETCHERS = {
+    'Tweets': 'user_tweets',
+    'Replies': 'user_tweets_and_replies',
+    'Media': 'user_media',
+    'Likes': 'user_likes'
+}
+NOTIFICATIONS_FETCHERS = {
+    'All': 'notifications_all',
+    'Verified': 'notifications_verified',
+    'Mentions': 'notifications_mentions'
+}
+# Names of the GQLClient methods behind each kind of get_user_friendships.
+USER_FRIENDSHIP_FETCHERS = {
+    'followers': 'followers',
+    'verified_followers': 'blue_verified_followers',
+    'followers_you_know': 'followers_you_know',
+    'following': 'following',
+    'subscriptions': 'user_creator_subscriptions'
+}
+# Maps create_tweet's conversation_control values to the API's limit modes.
+CONVERSATION_CONTROL_LIMIT_MODES = {
+    'followers': 'Community',
+    'verified': 'Verified',
+    'mentioned': 'ByInvitation'
+}
+
 
 class Client:
     """
@@ -77,6 +108,9 @@ class Client:
         (e.g., 'http://0.0.0.0:0000').
     captcha_solver : :class:`.Capsolver` | None, default=None
         See :class:`.Capsolver`.
+    http2 : :class:`bool`, default=False
+        Whether to use HTTP/2. Requires the `http2` extra
+        (``pip install twikit[http2]``).
 
     Examples
     --------
@@ -95,6 +129,7 @@ class Client:
         proxy: str | None = None,
         captcha_solver: Capsolver | None = None,
         user_agent: str | None = None,
+        http2: bool = False,
         **kwargs
     ) -> None:
         if 'proxies' in kwargs:
@@ -104,9 +139,22 @@ class Client:
             )
             warnings.warn(message)
 
-        self.http = AsyncClient(proxy=proxy, **kwargs)
+        # Connection options go to the transport built here, which is
+        # mounted for all requests (the same routing the proxy setter
+        # installs), so environment proxies are not used.
+        self._transport_options = {
+            'http2': http2,
+            'limits': kwargs.pop('limits', DEFAULT_LIMITS)
+        }
+        for key in ('verify', 'cert', 'http1'):
+            if key in kwargs:
+                self._transport_options[key] = kwargs.pop(key)
+        transport = AsyncHTTPTransport(proxy=proxy, **self._transport_options)
+        kwargs.setdefault('trust_env', False)
+        self.http = AsyncClient(
+            transport=transport, mounts={'all://': transport}, **kwargs
+        )
         self.language = language
-        self.proxy = proxy
         self.captcha_solver = captcha_solver
         if captcha_solver is not None:
             captcha_solver.client = self
@@ -116,6 +164,7 @@ class Client:
         self._user_id = None
         self._user_agent = user_agent or 'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_6_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.5 Safari/605.1.15'
         self._act_as = None
+        self._folder_cache: dict[str, BookmarkFolder] = {}
 
         self.gql = GQLClient(self)
         self.v11 = V11Client(self)
@@ -132,7 +181,7 @@ class Client:
         headers = kwargs.pop('headers', {})
 
         if not self.client_transaction.home_page_response:
-            cookies_backup = self.get_cookies().copy()
+            cookies_backup = self.get_cookies()
             ct_headers = {
                 'Accept-Language': f'{self.language},{self.language.split("-")[0]};q=0.9',
                 'Cache-Control': 'no-cache',
@@ -145,13 +194,13 @@ class Client:
         tid = self.client_transaction.generate_transaction_id(method=method, path=urlparse(url).path)
         headers['X-Client-Transaction-Id'] = tid
 
-        cookies_backup = self.get_cookies().copy()
+        cookies_backup = self.get_cookies()
         response = await self.http.request(method, url, headers=headers, **kwargs)
         self._remove_duplicate_ct0_cookie()
 
         try:
-            response_data = response.json()
-        except json.decoder.JSONDecodeError:
+            response_data = _json.loads(response.content)
+        except _json.JSONDecodeError:
             response_data = response.text
 
         if isinstance(response_data, dict) and 'errors' in response_data:
@@ -174,8 +223,8 @@ class Client:
                     response = await self.http.request(method, url, **kwargs)
                     self._remove_duplicate_ct0_cookie()
                     try:
-                        response_data = response.json()
-                    except json.decoder.JSONDecodeError:
+                        response_data = _json.loads(response.content)
+                    except _json.JSONDecodeError:
                         response_data = response.text
 
         status_code = response.status_code
@@ -234,7 +283,17 @@ class Client:
 
     @proxy.setter
     def proxy(self, url: str) -> None:
-        self.http._mounts = {URLPattern('all://'): AsyncHTTPTransport(proxy=url)}
+        self.http._mounts = {
+            URLPattern('all://'): AsyncHTTPTransport(
+                proxy=url, **self._transport_options
+            )
+        }
+
+    async def close(self) -> None:
+        """
+        Closes the HTTP client and releases its pooled connections.
+        """
+        await self.http.aclose()
 
     def _get_csrf_token(self) -> str:
         """
@@ -349,49 +408,7 @@ class Client:
                     }
                 }
             },
-            'subtask_versions': {
-                'action_list': 2,
-                'alert_dialog': 1,
-                'app_download_cta': 1,
-                'check_logged_in_account': 1,
-                'choice_selection': 3,
-                'contacts_live_sync_permission_prompt': 0,
-                'cta': 7,
-                'email_verification': 2,
-                'end_flow': 1,
-                'enter_date': 1,
-                'enter_email': 2,
-                'enter_password': 5,
-                'enter_phone': 2,
-                'enter_recaptcha': 1,
-                'enter_text': 5,
-                'enter_username': 2,
-                'generic_urt': 3,
-                'in_app_notification': 1,
-                'interest_picker': 3,
-                'js_instrumentation': 1,
-                'menu_dialog': 1,
-                'notifications_permission_prompt': 2,
-                'open_account': 2,
-                'open_home_timeline': 1,
-                'open_link': 1,
-                'phone_verification': 4,
-                'privacy_options': 1,
-                'security_key': 3,
-                'select_avatar': 4,
-                'select_banner': 2,
-                'settings_list': 7,
-                'show_code': 1,
-                'sign_up': 2,
-                'sign_up_review': 4,
-                'tweet_selection_urt': 1,
-                'update_users': 1,
-                'upload_media': 1,
-                'user_recommendations_list': 4,
-                'user_recommendations_urt': 1,
-                'wait_spinner': 3,
-                'web_modal': 1
-            }
+            'subtask_versions': LOGIN_SUBTASK_VERSIONS
         })
         await flow.sso_init('apple')
 
@@ -487,7 +504,7 @@ class Client:
         if not flow.response['subtasks']:
             return
 
-        self._user_id = find_dict(flow.response, 'id_str', find_one=True)[0]
+        self._user_id = find_first(flow.response, 'id_str')
         return flow.response
 
     async def logout(self) -> Response:
@@ -524,7 +541,7 @@ class Client:
                 ui_metrics=True
             )
 
-        cookies_backup = self.get_cookies().copy()
+        cookies_backup = self.get_cookies()
         max_unlock_attempts = self.captcha_solver.max_attempts
         attempt = 0
         while attempt < max_unlock_attempts:
@@ -533,7 +550,7 @@ class Client:
             if html.authenticity_token is None:
                 response, html = await self.captcha_solver.get_unlock_html()
 
-            result = self.captcha_solver.solve_funcaptcha(html.blob)
+            result = await self.captcha_solver.solve_funcaptcha(html.blob)
             if result['errorId'] == 1:
                 continue
 
@@ -574,7 +591,9 @@ class Client:
         .load_cookies
         .save_cookies
         """
-        return dict(self.http.cookies)
+        # Iterate the jar directly; Cookies.__getitem__ rescans the
+        # whole jar for every key.
+        return {cookie.name: cookie.value for cookie in self.http.cookies.jar}
 
     def save_cookies(self, path: str) -> None:
         """
@@ -597,8 +616,8 @@ class Client:
         .get_cookies
         .set_cookies
         """
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.get_cookies(), f)
+        with open(path, 'wb') as f:
+            f.write(_json.dumpb(self.get_cookies()))
 
     def set_cookies(self, cookies: dict, clear_cookies: bool = False) -> None:
         """
@@ -645,8 +664,8 @@ class Client:
         .save_cookies
         .set_cookies
         """
-        with open(path, 'r', encoding='utf-8') as f:
-            self.set_cookies(json.load(f))
+        with open(path, 'rb') as f:
+            self.set_cookies(_json.loads(f.read()))
 
     def set_delegate_account(self, user_id: str | None) -> None:
         """
@@ -752,21 +771,21 @@ class Client:
         previous_cursor = None
 
         results = []
+        users = {}
         for item in items:
-            if item['entryId'].startswith('cursor-bottom'):
+            entry_id = item['entryId']
+            if entry_id.startswith(('tweet', 'search-grid')):
+                try:
+                    tweet = tweet_from_data(self, item, users)
+                except KeyError:
+                    tweet = None
+
+                if tweet is not None:
+                    results.append(tweet)
+            elif entry_id.startswith('cursor-bottom'):
                 next_cursor = item['content']['value']
-            if item['entryId'].startswith('cursor-top'):
+            elif entry_id.startswith('cursor-top'):
                 previous_cursor = item['content']['value']
-            if not item['entryId'].startswith(('tweet', 'search-grid')):
-                continue
-
-            try:
-                tweet = tweet_from_data(self, item)
-            except KeyError:
-                tweet = None
-                
-            if tweet is not None:
-                results.append(tweet)
 
         if next_cursor is None:
             if product == 'Media':
@@ -828,14 +847,14 @@ class Client:
         ...
         """
         response, _ = await self.gql.search_timeline(query, 'People', count, cursor)
-        items = find_dict(response, 'entries', find_one=True)[0]
+        items = find_entries(response)
         next_cursor = items[-1]['content']['value']
 
         results = []
         for item in items:
             if 'itemContent' not in item['content']:
                 continue
-            user_info = find_dict(item, 'result', find_one=True)[0]
+            user_info = _user_result_from_entry(item)
             results.append(User(self, user_info))
 
         return Result(
@@ -860,20 +879,16 @@ class Client:
             similar to the specified tweet.
         """
         response, _ = await self.gql.similar_posts(tweet_id)
-        items_ = find_dict(response, 'entries', find_one=True)
-        results = []
-        if not items_:
-            return results
-
-        for item in items_[0]:
-            if not item['entryId'].startswith('tweet'):
-                continue
-
-            tweet = tweet_from_data(self, item)
-            if tweet is not None:
-                results.append(tweet)
-
-        return results
+        items = find_entries(response, None)
+        if items is None:
+            return []
+
+        users = {}
+        return [
+            tweet for item in items
+            if item['entryId'].startswith('tweet')
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
     async def get_user_highlights_tweets(
         self,
@@ -924,11 +939,12 @@ class Client:
         previous_cursor = None
         next_cursor = None
         results = []
+        users = {}
 
         for entry in entries:
             entryId = entry['entryId']
             if entryId.startswith('tweet'):
-                results.append(tweet_from_data(self, entry))
+                results.append(tweet_from_data(self, entry, users))
             elif entryId.startswith('cursor-top'):
                 previous_cursor = entry['content']['value']
             elif entryId.startswith('cursor-bottom'):
@@ -1005,57 +1021,73 @@ class Client:
 
         if isinstance(source, str):
             # If the source is a path
-            with open(source, 'rb') as file:
-                binary = file.read()
+            stream = open(source, 'rb')
         elif isinstance(source, bytes):
             # If the source is bytes
-            binary = source
-
-        if media_type is None:
-            # Guess mimetype if not specified
-            media_type = filetype.guess(binary).mime
+            stream = io.BytesIO(source)
+
+        # Segments are read from the stream as they are sent, so at most
+        # MAX_CONCURRENT_APPENDS segments are held in memory at once.
+        with stream:
+            total_bytes = stream.seek(0, os.SEEK_END)
+            stream.seek(0)
+
+            if media_type is None:
+                # Guess mimetype if not specified
+                media_type = filetype.guess(stream.read(8192)).mime
+                stream.seek(0)
+
+            if wait_for_completion:
+                if media_type == 'image/gif':
+                    if media_category is None:
+                        raise TwitterException(
+                            "`media_category` must be specified to check the "
+                            "upload status of gif images ('dm_gif' or 'tweet_gif')"
+                        )
+                elif media_type.startswith('image'):
+                    # Checking the upload status of an image is impossible.
+                    wait_for_completion = False
+
+            # ============ INIT =============
+            response, _ = await self.v11.upload_media_init(
+                media_type, total_bytes, media_category, is_long_video
+            )
+            media_id = response['media_id']
+            # =========== APPEND ============
+            MAX_SEGMENT_SIZE = 8 * 1024 * 1024  # The maximum segment size is 8 MB
+            MAX_CONCURRENT_APPENDS = 4
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_APPENDS)
 
-        if wait_for_completion:
-            if media_type == 'image/gif':
-                if media_category is None:
-                    raise TwitterException(
-                        "`media_category` must be specified to check the "
-                        "upload status of gif images ('dm_gif' or 'tweet_gif')"
+            async def append(segment_index: int, chunk: bytes) -> None:
+                try:
+                    await self.v11.upload_media_append(
+                        is_long_video, media_id, segment_index, chunk
                     )
-            elif media_type.startswith('image'):
-                # Checking the upload status of an image is impossible.
-                wait_for_completion = False
-
-        total_bytes = len(binary)
+                finally:
+                    semaphore.release()
 
-        # ============ INIT =============
-        response, _ = await self.v11.upload_media_init(
-            media_type, total_bytes, media_category, is_long_video
-        )
-        media_id = response['media_id']
-        # =========== APPEND ============
-        segment_index = 0
-        bytes_sent = 0
-        MAX_SEGMENT_SIZE = 8 * 1024 * 1024  # The maximum segment size is 8 MB
-        append_tasks = []
-        chunk_streams: list[io.BytesIO] = []
-
-        while bytes_sent < total_bytes:
-            chunk = binary[bytes_sent:bytes_sent + MAX_SEGMENT_SIZE]
-            chunk_stream = io.BytesIO(chunk)
-            coro = self.v11.upload_media_append(is_long_video, media_id, segment_index, chunk_stream)
-            append_tasks.append(asyncio.create_task(coro))
-            chunk_streams.append(chunk_stream)
-
-            segment_index += 1
-            bytes_sent += len(chunk)
-
-        append_gather = asyncio.gather(*append_tasks)
-        await append_gather
-
-        # Close chunk streams
-        for chunk_stream in chunk_streams:
-            chunk_stream.close()
+            append_tasks = []
+            segment_index = 0
+            try:
+                while True:
+                    await semaphore.acquire()
+                    for task in append_tasks:
+                        if task.done() and task.exception() is not None:
+                            raise task.exception()
+                    chunk = stream.read(MAX_SEGMENT_SIZE)
+                    if not chunk:
+                        semaphore.release()
+                        break
+                    append_tasks.append(asyncio.create_task(append(segment_index, chunk)))
+                    segment_index += 1
+
+                await asyncio.gather(*append_tasks)
+            except BaseException:
+                # Stop uploading segments of a media that will not be finalized.
+                for task in append_tasks:
+                    task.cancel()
+                await asyncio.gather(*append_tasks, return_exceptions=True)
+                raise
 
         # ========== FINALIZE ===========
         await self.v11.upload_media_finelize(is_long_video, media_id)
@@ -1279,16 +1311,12 @@ class Client:
         """
         media_entities = [
             {'media_id': media_id, 'tagged_users': []}
-            for media_id in (media_ids or [])
-        ]
+            for media_id in media_ids
+        ] if media_ids else []
         limit_mode = None
         if conversation_control is not None:
             conversation_control = conversation_control.lower()
-            limit_mode = {
-                'followers': 'Community',
-                'verified': 'Verified',
-                'mentioned': 'ByInvitation'
-            }[conversation_control]
+            limit_mode = CONVERSATION_CONTROL_LIMIT_MODES[conversation_control]
 
         response, _ = await self.gql.create_tweet(
             is_note_tweet, text, media_entities, poll_uri,
@@ -1369,6 +1397,37 @@ class Client:
         _, response = await self.gql.delete_tweet(tweet_id)
         return response
 
+    async def delete_tweets(
+        self, tweet_ids: list[str], max_concurrency: int = 8
+    ) -> list[Response]:
+        """
+        Deletes multiple tweets concurrently.
+
+        Parameters
+        ----------
+        tweet_ids : list[:class:`str`]
+            IDs of the tweets to be deleted.
+        max_concurrency : :class:`int`, default=8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list[:class:`httpx.Response`]
+            Responses returned from twitter api, in the same order
+            as `tweet_ids`.
+
+        Examples
+        --------
+        >>> await client.delete_tweets(['0000000000', '1111111111'])
+
+        See Also
+        --------
+        .delete_tweet
+        """
+        return await self._gather_limited(
+            self.delete_tweet, tweet_ids, max_concurrency
+        )
+
     async def get_user_by_screen_name(self, screen_name: str) -> User:
         """
         Fetches a user by screen name.
@@ -1431,6 +1490,50 @@ class Client:
             raise UserUnavailable(user_data.get('message'))
         return User(self, user_data)
 
+    async def get_users_by_ids(
+        self, user_ids: list[str], max_concurrency: int = 8
+    ) -> list[User]:
+        """
+        Fetches multiple users by ID concurrently.
+
+        Parameters
+        ----------
+        user_ids : list[:class:`str`]
+            The IDs of the Twitter users.
+        max_concurrency : :class:`int`, default=8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list[:class:`User`]
+            The users, in the same order as `user_ids`.
+
+        Examples
+        --------
+        >>> users = await client.get_users_by_ids(['000000000', '111111111'])
+        >>> print(users)
+        [<User id="000000000">, <User id="111111111">]
+        """
+        return await self._gather_limited(
+            self.get_user_by_id, user_ids, max_concurrency
+        )
+
+    @staticmethod
+    async def _gather_limited(
+        f, args: list, max_concurrency: int, return_exceptions: bool = False
+    ) -> list:
+        # Runs f(arg) for every arg concurrently, keeping at most
+        # `max_concurrency` requests in flight. Results keep the order of `args`.
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(arg):
+            async with semaphore:
+                return await f(arg)
+
+        return await asyncio.gather(
+            *(run(arg) for arg in args), return_exceptions=return_exceptions
+        )
+
     async def reverse_geocode(
         self, lat: float, long: float, accuracy: str | float | None = None,
         granularity: str | None = None, max_results: int | None = None
@@ -1512,15 +1615,13 @@ class Client:
         self, tweet_id: str, cursor: str
     ) -> Result[Tweet]:
         response, _ = await self.gql.tweet_detail(tweet_id, cursor)
-        entries = find_dict(response, 'entries', find_one=True)[0]
-
-        results = []
-        for entry in entries:
-            if entry['entryId'].startswith(('cursor', 'label')):
-                continue
-            tweet = tweet_from_data(self, entry)
-            if tweet is not None:
-                results.append(tweet)
+        entries = find_entries(response)
+        users = {}
+        results = [
+            tweet for entry in entries
+            if not entry['entryId'].startswith(('cursor', 'label'))
+            and (tweet := tweet_from_data(self, entry, users)) is not None
+        ]
 
         if entries[-1]['entryId'].startswith('cursor'):
             next_cursor = entries[-1]['content']['itemContent']['value']
@@ -1540,17 +1641,19 @@ class Client:
     ) -> Result[Tweet]:
         response, _ = await self.gql.tweet_detail(tweet_id, cursor)
         items = find_dict(response, 'moduleItems', find_one=True)[0]
-        results = []
-        for item in items:
-            if 'tweet' not in item['entryId']:
-                continue
-            tweet = tweet_from_data(self, item)
-            if tweet is not None:
-                results.append(tweet)
+        users = {}
+        results = [
+            tweet for item in items
+            if 'tweet' in item['entryId']
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
         return Result(results)
 
     async def get_tweet_by_id(
-        self, tweet_id: str, cursor: str | None = None
+        self,
+        tweet_id: str,
+        cursor: str | None = None,
+        prefetch_replies: bool = False
     ) -> Tweet:
         """
         Fetches a tweet by tweet ID.
@@ -1559,6 +1662,13 @@ class Client:
         ----------
         tweet_id : :class:`str`
             The ID of the tweet.
+        prefetch_replies : :class:`bool`, default=False
+            If True, the next page of replies and the hidden replies of
+            every reply thread are fetched concurrently, at most 8 at a
+            time, before this method returns. Later calls to `next` on
+            `tweet.replies` and on each reply's `replies` then return
+            without a round trip. A page that failed to load raises its
+            error from the corresponding `next` call.
 
         Returns
         -------
@@ -1577,16 +1687,17 @@ class Client:
         if 'errors' in response:
             raise TweetNotAvailable(response['errors'][0]['message'])
 
-        entries = find_dict(response, 'entries', find_one=True)[0]
+        entries = find_entries(response)
         reply_to = []
         replies_list = []
         related_tweets = []
         tweet = None
+        users = {}
 
         for entry in entries:
             if entry['entryId'].startswith('cursor'):
                 continue
-            tweet_object = tweet_from_data(self, entry)
+            tweet_object = tweet_from_data(self, entry, users)
             if tweet_object is None:
                 continue
 
@@ -1603,12 +1714,13 @@ class Client:
                     replies = []
                     sr_cursor = None
                     show_replies = None
+                    content_items = entry['content']['items']
 
-                    for reply in entry['content']['items'][1:]:
+                    for reply in content_items[1:]:
                         if 'tweetcomposer' in reply['entryId']:
                             continue
                         if 'tweet' in reply.get('entryId'):
-                            rpl = tweet_from_data(self, reply)
+                            rpl = tweet_from_data(self, reply, users)
                             if rpl is None:
                                 continue
                             replies.append(rpl)
@@ -1626,8 +1738,14 @@ class Client:
                     )
                     replies_list.append(tweet_object)
 
-                    display_type = find_dict(entry, 'tweetDisplayType', True)
-                    if display_type and display_type[0] == 'SelfThread':
+                    display_type = (
+                        content_items[0].get('item', {})
+                        .get('itemContent', {})
+                        .get('tweetDisplayType')
+                    )
+                    if display_type is None:
+                        display_type = find_first(content_items, 'tweetDisplayType')
+                    if display_type == 'SelfThread':
                         tweet.thread = [tweet_object, *replies]
 
         if entries[-1]['entryId'].startswith('cursor'):
@@ -1647,6 +1765,15 @@ class Client:
         tweet.reply_to = reply_to
         tweet.related_tweets = related_tweets
 
+        if prefetch_replies:
+            results = [tweet.replies, *(reply.replies for reply in replies_list)]
+            await self._gather_limited(
+                Result.prefetch,
+                [result for result in results if result.next_cursor is not None],
+                8,
+                return_exceptions=True
+            )
+
         return tweet
 
     async def get_tweets_by_ids(self, ids: list[str]) -> list[Tweet]:
@@ -1672,10 +1799,11 @@ class Client:
         """
         response, _ = await self.gql.tweet_results_by_rest_ids(ids)
         tweet_results = response['data']['tweetResult']
-        results = []
-        for tweet_result in tweet_results:
-            results.append(tweet_from_data(self, tweet_result))
-        return results
+        users = {}
+        return [
+            tweet_from_data(self, tweet_result, users)
+            for tweet_result in tweet_results
+        ]
 
     async def get_scheduled_tweets(self) -> list[ScheduledTweet]:
         """
@@ -1716,10 +1844,9 @@ class Client:
         type1: favoriters
         """
         response, _ = await f(tweet_id, count, cursor)
-        items_ = find_dict(response, 'entries', True)
-        if not items_:
+        items = find_entries(response, None)
+        if items is None:
             return Result([])
-        items = items_[0]
         next_cursor = items[-1]['content']['value']
         previous_cursor = items[-2]['content']['value']
 
@@ -1727,10 +1854,9 @@ class Client:
         for item in items:
             if not item['entryId'].startswith('user'):
                 continue
-            user_info_ = find_dict(item, 'result', True)
-            if not user_info_:
+            user_info = _user_result_from_entry(item)
+            if user_info is None:
                 continue
-            user_info = user_info_[0]
             results.append(User(self, user_info))
 
         return Result(
@@ -1902,12 +2028,7 @@ class Client:
         .get_user_by_screen_name
         """
         tweet_type = tweet_type.capitalize()
-        f = {
-            'Tweets': self.gql.user_tweets,
-            'Replies': self.gql.user_tweets_and_replies,
-            'Media': self.gql.user_media,
-            'Likes': self.gql.user_likes,
-        }[tweet_type]
+        f = getattr(self.gql, USER_TWEETS_FETCHERS[tweet_type])
         response, _ = await f(user_id, count, cursor)
 
         instructions_ = find_dict(response, 'instructions', True)
@@ -1926,25 +2047,25 @@ class Client:
                 items = instructions[0]['moduleItems']
 
         results = []
+        users = {}
         for item in items:
             entry_id = item['entryId']
 
-            if not entry_id.startswith(('tweet', 'profile-conversation', 'profile-grid')):
-                continue
-
             if entry_id.startswith('profile-conversation'):
                 tweets = item['content']['items']
                 replies = []
                 for reply in tweets[1:]:
-                    tweet_object = tweet_from_data(self, reply)
+                    tweet_object = tweet_from_data(self, reply, users)
                     if tweet_object is None:
                         continue
                     replies.append(tweet_object)
                 item = tweets[0]
-            else:
+            elif entry_id.startswith(('tweet', 'profile-grid')):
                 replies = None
+            else:
+                continue
 
-            tweet = tweet_from_data(self, item)
+            tweet = tweet_from_data(self, item, users)
             if tweet is None:
                 continue
             tweet.replies = replies
@@ -2000,17 +2121,14 @@ class Client:
         ...
         """
         response, _ = await self.gql.home_timeline(count, seen_tweet_ids, cursor)
-        items = find_dict(response, 'entries', find_one=True)[0]
+        items = find_entries(response)
         next_cursor = items[-1]['content']['value']
-        results = []
-
-        for item in items:
-            if 'itemContent' not in item['content']:
-                continue
-            tweet = tweet_from_data(self, item)
-            if tweet is None:
-                continue
-            results.append(tweet)
+        users = {}
+        results = [
+            tweet for item in items
+            if 'itemContent' in item['content']
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         return Result(
             results,
@@ -2060,17 +2178,14 @@ class Client:
         ...
         """
         response, _ = await self.gql.home_latest_timeline(count, seen_tweet_ids, cursor)
-        items = find_dict(response, 'entries', find_one=True)[0]
+        items = find_entries(response)
         next_cursor = items[-1]['content']['value']
-        results = []
-
-        for item in items:
-            if 'itemContent' not in item['content']:
-                continue
-            tweet = tweet_from_data(self, item)
-            if tweet is None:
-                continue
-            results.append(tweet)
+        users = {}
+        results = [
+            tweet for item in items
+            if 'itemContent' in item['content']
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         return Result(
             results,
@@ -2104,6 +2219,38 @@ class Client:
         _, response = await self.gql.favorite_tweet(tweet_id)
         return response
 
+    async def favorite_tweets(
+        self, tweet_ids: list[str], max_concurrency: int = 8
+    ) -> list[Response]:
+        """
+        Favorites multiple tweets concurrently.
+
+        Parameters
+        ----------
+        tweet_ids : list[:class:`str`]
+            IDs of the tweets to be liked.
+        max_concurrency : :class:`int`, default=8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list[:class:`httpx.Response`]
+            Responses returned from twitter api, in the same order
+            as `tweet_ids`.
+
+        Examples
+        --------
+        >>> await client.favorite_tweets(['...', '...'])
+
+        See Also
+        --------
+        .favorite_tweet
+        .unfavorite_tweets
+        """
+        return await self._gather_limited(
+            self.favorite_tweet, tweet_ids, max_concurrency
+        )
+
     async def unfavorite_tweet(self, tweet_id: str) -> Response:
         """
         Unfavorites a tweet.
@@ -2130,6 +2277,38 @@ class Client:
         _, response = await self.gql.unfavorite_tweet(tweet_id)
         return response
 
+    async def unfavorite_tweets(
+        self, tweet_ids: list[str], max_concurrency: int = 8
+    ) -> list[Response]:
+        """
+        Unfavorites multiple tweets concurrently.
+
+        Parameters
+        ----------
+        tweet_ids : list[:class:`str`]
+            IDs of the tweets to be unliked.
+        max_concurrency : :class:`int`, default=8
+            The maximum number of requests in flight at once.
+
+        Returns
+        -------
+        list[:class:`httpx.Response`]
+            Responses returned from twitter api, in the same order
+            as `tweet_ids`.
+
+        Examples
+        --------
+        >>> await client.unfavorite_tweets(['...', '...'])
+
+        See Also
+        --------
+        .unfavorite_tweet
+        .favorite_tweets
+        """
+        return await self._gather_limited(
+            self.unfavorite_tweet, tweet_ids, max_concurrency
+        )
+
     async def retweet(self, tweet_id: str) -> Response:
         """
         Retweets a tweet.
@@ -2277,10 +2456,9 @@ class Client:
         else:
             response, _ = await self.gql.bookmark_folder_timeline(count, cursor, folder_id)
 
-        items_ = find_dict(response, 'entries', find_one=True)
-        if not items_:
+        items = find_entries(response, None)
+        if items is None:
             return Result([])
-        items = items_[0]
         next_cursor = items[-1]['content']['value']
         if folder_id is None:
             previous_cursor = items[-2]['content']['value']
@@ -2289,12 +2467,11 @@ class Client:
             previous_cursor = None
             fetch_previous_result = None
 
-        results = []
-        for item in items:
-            tweet = tweet_from_data(self, item)
-            if tweet is None:
-                continue
-            results.append(tweet)
+        users = {}
+        results = [
+            tweet for item in items
+            if (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         return Result(
             results,
@@ -2341,7 +2518,9 @@ class Client:
         slice = find_dict(response, 'bookmark_collections_slice', find_one=True)[0]
         results = []
         for item in slice['items']:
-            results.append(BookmarkFolder(self, item))
+            folder = BookmarkFolder(self, item)
+            self._folder_cache[folder.id] = folder
+            results.append(folder)
 
         if 'next_cursor' in slice['slice_info']:
             next_cursor = slice['slice_info']['next_cursor']
@@ -2356,6 +2535,43 @@ class Client:
             next_cursor
         )
 
+    async def iter_bookmark_folders(
+        self, cursor: str | None = None
+    ) -> AsyncGenerator[BookmarkFolder, None]:
+        """
+        Iterates over all bookmark folders, fetching further pages
+        as needed. Unlike :meth:`get_bookmark_folders`, the folders are
+        yielded one by one as each page is read, so the full list is
+        never built.
+
+        Parameters
+        ----------
+        cursor : :class:`str`, default=None
+            Cursor of the page to start from.
+
+        Yields
+        ------
+        :class:`BookmarkFolder`
+
+        Examples
+        --------
+        >>> async for folder in client.iter_bookmark_folders():
+        ...     print(folder)
+        <BookmarkFolder id="...">
+        <BookmarkFolder id="...">
+        """
+        while True:
+            response, _ = await self.gql.bookmark_folders_slice(cursor)
+            slice = find_dict(response, 'bookmark_collections_slice', find_one=True)[0]
+            for item in slice['items']:
+                folder = BookmarkFolder(self, item)
+                self._folder_cache[folder.id] = folder
+                yield folder
+
+            cursor = slice['slice_info'].get('next_cursor')
+            if cursor is None or not slice['items']:
+                return
+
     async def edit_bookmark_folder(
         self, folder_id: str, name: str
     ) -> BookmarkFolder:
@@ -2379,7 +2595,9 @@ class Client:
         >>> await client.edit_bookmark_folder('123456789', 'MyFolder')
         """
         response, _ = await self.gql.edit_bookmark_folder(folder_id, name)
-        return BookmarkFolder(self, response['data']['bookmark_collection_update'])
+        folder = BookmarkFolder(self, response['data']['bookmark_collection_update'])
+        self._folder_cache[folder.id] = folder
+        return folder
 
     async def delete_bookmark_folder(self, folder_id: str) -> Response:
         """
@@ -2396,6 +2614,7 @@ class Client:
             Response returned from twitter api.
         """
         _, response = await self.gql.delete_bookmark_folder(folder_id)
+        self._folder_cache.pop(folder_id, None)
         return response
 
     async def create_bookmark_folder(self, name: str) -> BookmarkFolder:
@@ -2412,7 +2631,32 @@ class Client:
             Newly created bookmark folder.
         """
         response, _ = await self.gql.create_bookmark_folder(name)
-        return BookmarkFolder(self, response['data']['bookmark_collection_create'])
+        folder = BookmarkFolder(self, response['data']['bookmark_collection_create'])
+        self._folder_cache[folder.id] = folder
+        return folder
+
+    def get_cached_bookmark_folder(self, folder_id: str) -> BookmarkFolder | None:
+        """
+        Returns a bookmark folder that has already been loaded by this
+        client, without making a request.
+
+        Parameters
+        ----------
+        folder_id : :class:`str`
+            ID of the folder.
+
+        Returns
+        -------
+        :class:`BookmarkFolder` | None
+            The folder, or None if it has not been loaded yet.
+
+        Examples
+        --------
+        >>> await client.get_bookmark_folders()
+        >>> client.get_cached_bookmark_folder('123456789')
+        <BookmarkFolder id="123456789">
+        """
+        return self._folder_cache.get(folder_id)
 
     async def follow_user(self, user_id: str) -> User:
         """
@@ -2572,7 +2816,8 @@ class Client:
         count : :class:`int`, default=20
             The number of trends to retrieve.
         retry : :class:`bool`, default=True
-            If no trends are fetched continuously retry to fetch trends.
+            If no trends are fetched, retry up to four more times
+            with an increasing delay.
         additional_request_params : :class:`dict`, default=None
             Parameters to be added on top of the existing trends API
             parameters. Typically, it is used as `additional_request_params =
@@ -2596,28 +2841,27 @@ class Client:
         category = category.lower()
         if category in ['news', 'sports', 'entertainment']:
             category += '_unified'
-        response, _ = await self.v11.guide(category, count, additional_request_params)
-
         entry_id_prefix = 'trends' if category == 'trending' else 'Guide'
-        entries = [
-            i for i in find_dict(response, 'entries', find_one=True)[0]
-            if i['entryId'].startswith(entry_id_prefix)
-        ]
 
-        if not entries:
-            if not retry:
-                return []
-            # Recall the method again, as the trend information
-            # may not be returned due to a Twitter error.
-            return await self.get_trends(category, count, retry, additional_request_params)
-
-        items = entries[-1]['content']['timelineModule']['items']
+        # The trend information is sometimes missing from the response due
+        # to a Twitter error, so the request is retried with a backoff.
+        attempts = 5 if retry else 1
+        for attempt in range(attempts):
+            response, _ = await self.v11.guide(category, count, additional_request_params)
+            entry = next((
+                i for i in reversed(find_entries(response))
+                if i['entryId'].startswith(entry_id_prefix)
+            ), None)
+            if entry is not None:
+                break
+            if attempt + 1 < attempts:
+                await asyncio.sleep(0.2 * 2 ** attempt)
+        else:
+            return []
 
-        results = []
-        for item in items:
-            trend_info = item['item']['content']['trend']
-            results.append(Trend(self, trend_info))
+        items = entry['content']['timelineModule']['items']
 
+        results = [Trend(self, item['item']['content']['trend']) for item in items]
         return results
 
     async def get_available_locations(self) -> list[Location]:
@@ -2655,25 +2899,24 @@ class Client:
         """
         response, _ = await f(user_id, count, cursor)
 
-        items_ = find_dict(response, 'entries', find_one=True)
-        if not items_:
+        items = find_entries(response, None)
+        if items is None:
             return Result.empty()
-        items = items_[0]
         results = []
         for item in items:
             entry_id = item['entryId']
             if entry_id.startswith('user'):
-                user_info = find_dict(item, 'result', find_one=True)
-                if not user_info:
+                user_info = _user_result_from_entry(item)
+                if user_info is None:
                     warnings.warn(
                         'Some followers are excluded because '
                         '"Quality Filter" is enabled. To get all followers, '
                         'turn off it in the Twitter settings.'
                     )
                     continue
-                if user_info[0].get('__typename') == 'UserUnavailable':
+                if user_info.get('__typename') == 'UserUnavailable':
                     continue
-                results.append(User(self, user_info[0]))
+                results.append(User(self, user_info))
             elif entry_id.startswith('cursor-bottom'):
                 next_cursor = item['content']['value']
 
@@ -2838,6 +3081,51 @@ class Client:
             user_id, count, self.gql.user_creator_subscriptions, cursor
         )
 
+    async def get_user_friendships(
+        self,
+        user_id: str,
+        kinds: list[Literal[
+            'followers', 'verified_followers', 'followers_you_know',
+            'following', 'subscriptions'
+        ]],
+        count: int = 20
+    ) -> dict[str, Result[User]]:
+        """
+        Retrieves several kinds of user lists for a user concurrently.
+
+        Parameters
+        ----------
+        user_id : :class:`str`
+            The ID of the user.
+        kinds : list[:class:`str`]
+            The lists to retrieve. Each of 'followers', 'verified_followers',
+            'followers_you_know', 'following' and 'subscriptions'
+            corresponds to the `get_user_*` method of the same name.
+        count : :class:`int`, default=20
+            The number of users to retrieve for each list.
+
+        Returns
+        -------
+        dict[:class:`str`, Result[:class:`User`]]
+            A dictionary mapping each requested kind to its result.
+
+        Examples
+        --------
+        >>> lists = await client.get_user_friendships(
+        ...     user_id, ['followers', 'following']
+        ... )
+        >>> print(lists['followers'])
+        [<User id="...">, <User id="...">, ..., <User id="...">]
+        """
+        results = await asyncio.gather(*(
+            self._get_user_friendship(
+                user_id, count,
+                getattr(self.gql, USER_FRIENDSHIP_FETCHERS[kind]), None
+            )
+            for kind in kinds
+        ))
+        return dict(zip(kinds, results))
+
     async def _get_friendship_ids(
         self,
         user_id: str | None,
@@ -2925,6 +3213,16 @@ class Client:
         response, _ = await self.v11.dm_new(conversation_id, text, media_id, reply_to)
         return response
 
+    @staticmethod
+    def _sent_message_data(response: dict) -> dict:
+        """
+        Extracts the message data from a dm_new response.
+        """
+        try:
+            return response['entries'][0]['message']['message_data']
+        except (KeyError, IndexError):
+            return find_first(response, 'message_data')
+
     async def _get_dm_history(
         self,
         conversation_id: str,
@@ -2982,13 +3280,15 @@ class Client:
             f'{user_id}-{await self.user_id()}', text, media_id, reply_to
         )
 
-        message_data = find_dict(response, 'message_data', find_one=True)[0]
-        users = list(response['users'].values())
+        message_data = self._sent_message_data(response)
+        users = iter(response['users'].values())
+        sender_id = next(users)['id_str']
+        recipient = next(users, None)
         return Message(
             self,
             message_data,
-            users[0]['id_str'],
-            users[1]['id_str'] if len(users) == 2 else users[0]['id_str']
+            sender_id,
+            sender_id if recipient is None else recipient['id_str']
         )
 
     async def add_reaction_to_message(
@@ -3189,12 +3489,12 @@ class Client:
         """
         response = await self._send_dm(group_id, text, media_id, reply_to)
 
-        message_data = find_dict(response, 'message_data', find_one=True)[0]
-        users = list(response['users'].values())
+        message_data = self._sent_message_data(response)
+        sender = next(iter(response['users'].values()))
         return GroupMessage(
             self,
             message_data,
-            users[0]['id_str'],
+            sender['id_str'],
             group_id
         )
 
@@ -3511,7 +3811,7 @@ class Client:
         """
         response, _ = await self.gql.list_management_pace_timeline(count, cursor)
 
-        entries = find_dict(response, 'entries', find_one=True)[0]
+        entries = find_entries(response)
         items = find_dict(entries, 'items')
 
         if len(items) < 2:
@@ -3589,20 +3889,17 @@ class Client:
         """
         response, _ = await self.gql.list_latest_tweets_timeline(list_id, count, cursor)
 
-        items_ = find_dict(response, 'entries', find_one=True)
-        if not items_:
+        items = find_entries(response, None)
+        if items is None:
             raise ValueError(f'Invalid list id: {list_id}')
-        items = items_[0]
         next_cursor = items[-1]['content']['value']
 
-        results = []
-        for item in items:
-            if not item['entryId'].startswith('tweet'):
-                continue
-
-            tweet = tweet_from_data(self, item)
-            if tweet is not None:
-                results.append(tweet)
+        users = {}
+        results = [
+            tweet for item in items
+            if item['entryId'].startswith('tweet')
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         return Result(
             results,
@@ -3616,12 +3913,12 @@ class Client:
         """
         response, _ = await f(list_id, count, cursor)
 
-        items = find_dict(response, 'entries', find_one=True)[0]
+        items = find_entries(response)
         results = []
         for item in items:
             entry_id = item['entryId']
             if entry_id.startswith('user'):
-                user_info = find_dict(item, 'result', find_one=True)[0]
+                user_info = _user_result_from_entry(item)
                 results.append(User(self, user_info))
             elif entry_id.startswith('cursor-bottom'):
                 next_cursor = item['content']['value']
@@ -3724,7 +4021,7 @@ class Client:
         >>> more_lists = await lists.next()  # Retrieve more lists
         """
         response, _ = await self.gql.search_timeline(query, 'Lists', count, cursor)
-        entries = find_dict(response, 'entries', find_one=True)[0]
+        entries = find_entries(response)
 
         if cursor is None:
             items = entries[0]['content']['items']
@@ -3780,11 +4077,7 @@ class Client:
         >>> more_notifications = await notifications.next()
         """
         type = type.capitalize()
-        f = {
-            'All': self.v11.notifications_all,
-            'Verified': self.v11.notifications_verified,
-            'Mentions': self.v11.notifications_mentions
-        }[type]
+        f = getattr(self.v11, NOTIFICATIONS_FETCHERS[type])
         response, _ = await f(count, cursor)
 
         global_objects = response['globalObjects']
@@ -3820,7 +4113,7 @@ class Client:
 
             notifications.append(Notification(self, notification, tweet, user))
 
-        entries = find_dict(response, 'entries', find_one=True)[0]
+        entries = find_entries(response)
         cursor_bottom_entry = [
             i for i in entries
             if i['entryId'].startswith('cursor-bottom')
@@ -3897,7 +4190,7 @@ class Client:
             Community object.
         """
         response, _ = await self.gql.community_query(community_id)
-        community_data = find_dict(response, 'result', find_one=True)[0]
+        community_data = find_first(response, 'result')
         return Community(self, community_data)
 
     async def get_community_tweets(
@@ -3944,7 +4237,7 @@ class Client:
         else:
             raise ValueError(f'Invalid tweet_type: {tweet_type}')
 
-        entries = find_dict(response, 'entries', find_one=True)[0]
+        entries = find_entries(response)
         if tweet_type == 'Media':
             if cursor is None:
                 items = entries[0]['content']['items']
@@ -3959,14 +4252,12 @@ class Client:
             next_cursor = items[-1]['content']['value']
             previous_cursor = items[-2]['content']['value']
 
-        tweets = []
-        for item in items:
-            if not item['entryId'].startswith(('tweet', 'communities-grid')):
-                continue
-
-            tweet = tweet_from_data(self, item)
-            if tweet is not None:
-                tweets.append(tweet)
+        users = {}
+        tweets = [
+            tweet for item in items
+            if item['entryId'].startswith(('tweet', 'communities-grid'))
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         return Result(
             tweets,
@@ -4003,12 +4294,12 @@ class Client:
         >>> more_tweets = await tweets.next()  # Retrieve more tweets
         """
         response, _ = await self.gql.communities_main_page_timeline(count, cursor)
-        items = find_dict(response, 'entries', find_one=True)[0]
+        items = find_entries(response)
         tweets = []
         for item in items:
             if not item['entryId'].startswith('tweet'):
                 continue
-            tweet_data = find_dict(item, 'result', find_one=True)[0]
+            tweet_data = _tweet_result_from_entry(item)
             if 'tweet' in tweet_data:
                 tweet_data = tweet_data['tweet']
             user_data = tweet_data['core']['user_results']['result']
@@ -4087,7 +4378,7 @@ class Client:
             The requested community.
         """
         response, _ = await self.gql.request_to_join_community(community_id, answer)
-        community_data = find_dict(response, 'result', find_one=True)[0]
+        community_data = find_first(response, 'result')
         community_data['rest_id'] = community_data['id_str']
         return Community(self, community_data)
 
@@ -4188,15 +4479,13 @@ class Client:
         """
         response, _ = await self.gql.community_tweet_search_module_query(community_id, query, count, cursor)
 
-        items = find_dict(response, 'entries', find_one=True)[0]
-        tweets = []
-        for item in items:
-            if not item['entryId'].startswith('tweet'):
-                continue
-
-            tweet = tweet_from_data(self, item)
-            if tweet is not None:
-                tweets.append(tweet)
+        items = find_entries(response)
+        users = {}
+        tweets = [
+            tweet for item in items
+            if item['entryId'].startswith('tweet')
+            and (tweet := tweet_from_data(self, item, users)) is not None
+        ]
 
         next_cursor = items[-1]['content']['value']
         previous_cursor = items[-2]['content']['value']
@@ -4219,8 +4508,8 @@ class Client:
             self._remove_duplicate_ct0_cookie()
             async for line in response.aiter_lines():
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
+                    data = _json.loads(line)
+                except _json.JSONDecodeError:
                     continue
                 payload = _payload_from_data(data['payload'])
                 yield data.get('topic'), payload
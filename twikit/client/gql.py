@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from httpx import QueryParams
 
 from ..constants import (
     DOMAIN,
@@ -17,6 +21,7 @@ from ..constants import (
     USER_FEATURES,
     USER_HIGHLIGHTS_TWEETS_FEATURES
 )
+from .. import _json
 from ..utils import flatten_params, get_query_id
 
 if TYPE_CHECKING:
@@ -25,6 +30,59 @@ if TYPE_CHECKING:
 
     ClientType = Client | GuestClient
 
+# Feature flags are constant, so they are serialized once at import time.
+# gql_get and gql_post splice these strings into the request as they are.
+FEATURES_JSON = _json.dumps(FEATURES)
+USER_FEATURES_JSON = _json.dumps(USER_FEATURES)
+LIST_FEATURES_JSON = _json.dumps(LIST_FEATURES)
+NOTE_TWEET_FEATURES_JSON = _json.dumps(NOTE_TWEET_FEATURES)
+JOIN_COMMUNITY_FEATURES_JSON = _json.dumps(JOIN_COMMUNITY_FEATURES)
+COMMUNITY_NOTE_FEATURES_JSON = _json.dumps(COMMUNITY_NOTE_FEATURES)
+COMMUNITY_TWEETS_FEATURES_JSON = _json.dumps(COMMUNITY_TWEETS_FEATURES)
+SIMILAR_POSTS_FEATURES_JSON = _json.dumps(SIMILAR_POSTS_FEATURES)
+BOOKMARK_FOLDER_TIMELINE_FEATURES_JSON = _json.dumps(BOOKMARK_FOLDER_TIMELINE_FEATURES)
+TWEET_RESULT_BY_REST_ID_FEATURES_JSON = _json.dumps(TWEET_RESULT_BY_REST_ID_FEATURES)
+USER_HIGHLIGHTS_TWEETS_FEATURES_JSON = _json.dumps(USER_HIGHLIGHTS_TWEETS_FEATURES)
+TWEET_RESULTS_BY_REST_IDS_FEATURES_JSON = _json.dumps(TWEET_RESULTS_BY_REST_IDS_FEATURES)
+BOOKMARKS_FEATURES_JSON = _json.dumps(FEATURES | {'graphql_timeline_v2_bookmark_timeline': True})
+COMMUNITY_QUERY_FEATURES_JSON = _json.dumps({
+    'c9s_list_members_action_api_enabled': False,
+    'c9s_superc9s_indication_enabled': False
+})
+COMMUNITY_USERS_FEATURES_JSON = _json.dumps({
+    'responsive_web_graphql_timeline_navigation_enabled': True
+})
+
+
+@lru_cache(maxsize=None)
+def _features_query(features: str) -> str:
+    # Percent-encodes a pre-serialized features string once per constant.
+    return 'features=' + quote(features, safe='')
+
+
+@lru_cache(maxsize=None)
+def _features_body(features: str) -> bytes:
+    # Closing member of a POST body for a pre-serialized features string.
+    return b',"features":' + features.encode() + b'}'
+
+
+# Profiles are often refetched by the same id or screen name, so their
+# serialized variables are kept in a bounded cache.
+@lru_cache(maxsize=1024)
+def _user_by_screen_name_variables(screen_name: str) -> str:
+    return _json.dumps({
+        'screen_name': screen_name,
+        'withSafetyModeUserFields': False
+    })
+
+
+@lru_cache(maxsize=1024)
+def _user_by_rest_id_variables(user_id: str) -> str:
+    return _json.dumps({
+        'userId': user_id,
+        'withSafetyModeUserFields': True
+    })
+
 
 class Endpoint:
     @staticmethod
@@ -101,6 +159,13 @@ class Endpoint:
     TWEET_RESULTS_BY_REST_IDS = url('PTN9HhBAlpoCTHfspDgqLA/TweetResultsByRestIds')
 
 
+# Request body of DeleteAll, which takes no variables.
+DELETE_ALL_BOOKMARKS_BODY = _json.dumpb({
+    'variables': {},
+    'queryId': get_query_id(Endpoint.BOOKMARKS_ALL_DELETE)
+})
+
+
 class GQLClient:
     def __init__(self, base: ClientType) -> None:
         self.base = base
@@ -108,38 +173,50 @@ class GQLClient:
     async def gql_get(
         self,
         url: str,
-        variables: dict,
-        features: dict | None = None,
+        variables: dict | str,
+        features: dict | str | None = None,
         headers: dict | None = None,
         extra_params: dict | None = None,
         **kwargs
     ):
         params = {'variables': variables}
-        if features is not None:
+        if features is not None and not isinstance(features, str):
             params['features'] = features
         if extra_params is not None:
             params |= extra_params
+        # The query string is built here rather than passed as params=,
+        # since httpx would decode and re-encode the features fragment
+        # when merging params into a URL that already has a query.
+        query = str(QueryParams(flatten_params(params)))
+        if isinstance(features, str):
+            query = f'{_features_query(features)}&{query}'
         if headers is None:
             headers = self.base._base_headers
-        return await self.base.get(url, params=flatten_params(params), headers=headers, **kwargs)
+        return await self.base.get(f'{url}?{query}', headers=headers, **kwargs)
 
     async def gql_post(
         self,
         url: str,
         variables: dict,
-        features: dict | None = None,
+        features: dict | str | None = None,
         headers: dict | None = None,
         extra_data: dict | None = None,
         **kwargs
     ):
         data = {'variables': variables, 'queryId': get_query_id(url)}
-        if features is not None:
+        if features is not None and not isinstance(features, str):
             data['features'] = features
         if extra_data is not None:
             data |= extra_data
+        content = _json.dumpb(data)
+        if isinstance(features, str):
+            # Splice the pre-serialized features in as the last member
+            # instead of encoding the constant dict on every request.
+            content = content[:-1] + _features_body(features)
         if headers is None:
             headers = self.base._base_headers
-        return await self.base.post(url, json=data, headers=headers, **kwargs)
+        # The base headers already carry the JSON content-type.
+        return await self.base.post(url, content=content, headers=headers, **kwargs)
 
     async def search_timeline(
         self,
@@ -156,14 +233,14 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.SEARCH_TIMELINE, variables, FEATURES)
+        return await self.gql_get(Endpoint.SEARCH_TIMELINE, variables, FEATURES_JSON)
 
     async def similar_posts(self, tweet_id: str):
         variables = {'tweet_id': tweet_id}
         return await self.gql_get(
             Endpoint.SIMILAR_POSTS,
             variables,
-            SIMILAR_POSTS_FEATURES
+            SIMILAR_POSTS_FEATURES_JSON
         )
 
     async def create_tweet(
@@ -217,10 +294,10 @@ class GQLClient:
 
         if is_note_tweet:
             endpoint = Endpoint.CREATE_NOTE_TWEET
-            features = NOTE_TWEET_FEATURES
+            features = NOTE_TWEET_FEATURES_JSON
         else:
             endpoint = Endpoint.CREATE_TWEET
-            features = FEATURES
+            features = FEATURES_JSON
         return await self.gql_post(endpoint, variables, features)
 
     async def create_scheduled_tweet(self, scheduled_at, text, media_ids) -> str:
@@ -243,21 +320,15 @@ class GQLClient:
         return await self.gql_post(Endpoint.DELETE_TWEET, variables)
 
     async def user_by_screen_name(self, screen_name):
-        variables = {
-            'screen_name': screen_name,
-            'withSafetyModeUserFields': False
-        }
+        variables = _user_by_screen_name_variables(screen_name)
         params = {
             'fieldToggles': {'withAuxiliaryUserLabels': False}
         }
-        return await self.gql_get(Endpoint.USER_BY_SCREEN_NAME, variables, USER_FEATURES, extra_params=params)
+        return await self.gql_get(Endpoint.USER_BY_SCREEN_NAME, variables, USER_FEATURES_JSON, extra_params=params)
 
     async def user_by_rest_id(self, user_id):
-        variables = {
-            'userId': user_id,
-            'withSafetyModeUserFields': True
-        }
-        return await self.gql_get(Endpoint.USER_BY_REST_ID, variables, USER_FEATURES)
+        variables = _user_by_rest_id_variables(user_id)
+        return await self.gql_get(Endpoint.USER_BY_REST_ID, variables, USER_FEATURES_JSON)
 
     async def tweet_detail(self, tweet_id, cursor):
         variables = {
@@ -275,7 +346,7 @@ class GQLClient:
         params = {
             'fieldToggles': {'withAuxiliaryUserLabels': False}
         }
-        return await self.gql_get(Endpoint.TWEET_DETAIL, variables, FEATURES, extra_params=params)
+        return await self.gql_get(Endpoint.TWEET_DETAIL, variables, FEATURES_JSON, extra_params=params)
 
     async def fetch_scheduled_tweets(self):
         variables = {'ascending': True}
@@ -293,7 +364,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(endpoint, variables, FEATURES)
+        return await self.gql_get(endpoint, variables, FEATURES_JSON)
 
     async def retweeters(self, tweet_id, count, cursor):
         return await self.tweet_engagements(tweet_id, count, cursor, Endpoint.RETWEETERS)
@@ -303,7 +374,7 @@ class GQLClient:
 
     async def bird_watch_one_note(self, note_id):
         variables = {'note_id': note_id}
-        return await self.gql_get(Endpoint.FETCH_COMMUNITY_NOTE, variables, COMMUNITY_NOTE_FEATURES)
+        return await self.gql_get(Endpoint.FETCH_COMMUNITY_NOTE, variables, COMMUNITY_NOTE_FEATURES_JSON)
 
     async def _get_user_tweets(self, user_id, count, cursor, endpoint):
         variables = {
@@ -316,7 +387,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(endpoint, variables, FEATURES)
+        return await self.gql_get(endpoint, variables, FEATURES_JSON)
 
     async def user_tweets(self, user_id, count, cursor):
         return await self._get_user_tweets(user_id, count, cursor, Endpoint.USER_TWEETS)
@@ -342,7 +413,7 @@ class GQLClient:
         return await self.gql_get(
             Endpoint.USER_HIGHLIGHTS_TWEETS,
             variables,
-            USER_HIGHLIGHTS_TWEETS_FEATURES,
+            USER_HIGHLIGHTS_TWEETS_FEATURES_JSON,
             self.base._base_headers
         )
 
@@ -357,7 +428,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_post(Endpoint.HOME_TIMELINE, variables, FEATURES)
+        return await self.gql_post(Endpoint.HOME_TIMELINE, variables, FEATURES_JSON)
 
     async def home_latest_timeline(self, count, seen_tweet_ids, cursor):
         variables = {
@@ -370,7 +441,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_post(Endpoint.HOME_LATEST_TIMELINE, variables, FEATURES)
+        return await self.gql_post(Endpoint.HOME_LATEST_TIMELINE, variables, FEATURES_JSON)
 
     async def favorite_tweet(self, tweet_id):
         variables = {'tweet_id': tweet_id}
@@ -408,20 +479,9 @@ class GQLClient:
             'count': count,
             'includePromotedContent': True
         }
-        features = FEATURES | {
-            'graphql_timeline_v2_bookmark_timeline': True
-        }
         if cursor is not None:
             variables['cursor'] = cursor
-        params = flatten_params({
-            'variables': variables,
-            'features': features
-        })
-        return await self.base.get(
-            Endpoint.BOOKMARKS,
-            params=params,
-            headers=self.base._base_headers
-        )
+        return await self.gql_get(Endpoint.BOOKMARKS, variables, BOOKMARKS_FEATURES_JSON)
 
     async def bookmark_folder_timeline(self, count, cursor, folder_id):
         variables = {
@@ -432,10 +492,14 @@ class GQLClient:
         variables['bookmark_collection_id'] = folder_id
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.BOOKMARK_FOLDER_TIMELINE, variables, BOOKMARK_FOLDER_TIMELINE_FEATURES)
+        return await self.gql_get(Endpoint.BOOKMARK_FOLDER_TIMELINE, variables, BOOKMARK_FOLDER_TIMELINE_FEATURES_JSON)
 
     async def delete_all_bookmarks(self):
-        return await self.gql_post(Endpoint.BOOKMARKS_ALL_DELETE, {})
+        return await self.base.post(
+            Endpoint.BOOKMARKS_ALL_DELETE,
+            content=DELETE_ALL_BOOKMARKS_BODY,
+            headers=self.base._base_headers
+        )
 
     async def bookmark_folders_slice(self, cursor):
         variables = {}
@@ -467,7 +531,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(endpoint, variables, FEATURES)
+        return await self.gql_get(endpoint, variables, FEATURES_JSON)
 
     async def followers(self, user_id, count, cursor):
         return await self._friendships(user_id, count, Endpoint.FOLLOWERS, cursor)
@@ -519,18 +583,18 @@ class GQLClient:
             'name': name,
             'description': description
         }
-        return await self.gql_post(Endpoint.CREATE_LIST, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.CREATE_LIST, variables, LIST_FEATURES_JSON)
 
     async def edit_list_banner(self, list_id, media_id):
         variables = {
             'listId': list_id,
             'mediaId': media_id
         }
-        return await self.gql_post(Endpoint.EDIT_LIST_BANNER, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.EDIT_LIST_BANNER, variables, LIST_FEATURES_JSON)
 
     async def delete_list_banner(self, list_id):
         variables = {'listId': list_id}
-        return await self.gql_post(Endpoint.DELETE_LIST_BANNER, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.DELETE_LIST_BANNER, variables, LIST_FEATURES_JSON)
 
     async def update_list(self, list_id, name, description, is_private):
         variables = {'listId': list_id}
@@ -540,43 +604,43 @@ class GQLClient:
             variables['description'] = description
         if is_private is not None:
             variables['isPrivate'] = is_private
-        return await self.gql_post(Endpoint.UPDATE_LIST, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.UPDATE_LIST, variables, LIST_FEATURES_JSON)
 
     async def list_add_member(self, list_id, user_id):
         variables = {
             'listId': list_id,
             'userId': user_id
         }
-        return await self.gql_post(Endpoint.LIST_ADD_MEMBER, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.LIST_ADD_MEMBER, variables, LIST_FEATURES_JSON)
 
     async def list_remove_member(self, list_id, user_id):
         variables = {
             'listId': list_id,
             'userId': user_id
         }
-        return await self.gql_post(Endpoint.LIST_REMOVE_MEMBER, variables, LIST_FEATURES)
+        return await self.gql_post(Endpoint.LIST_REMOVE_MEMBER, variables, LIST_FEATURES_JSON)
 
     async def list_management_pace_timeline(self, count, cursor):
         variables = {'count': count}
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.LIST_MANAGEMENT_PACE_TIMELINE, variables, FEATURES)
+        return await self.gql_get(Endpoint.LIST_MANAGEMENT_PACE_TIMELINE, variables, FEATURES_JSON)
 
     async def list_by_rest_id(self, list_id):
         variables = {'listId': list_id}
-        return await self.gql_get(Endpoint.LIST_BY_REST_ID, variables, LIST_FEATURES)
+        return await self.gql_get(Endpoint.LIST_BY_REST_ID, variables, LIST_FEATURES_JSON)
 
     async def list_latest_tweets_timeline(self, list_id, count, cursor):
         variables = {'listId': list_id, 'count': count}
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.LIST_LATEST_TWEETS_TIMELINE, variables, FEATURES)
+        return await self.gql_get(Endpoint.LIST_LATEST_TWEETS_TIMELINE, variables, FEATURES_JSON)
 
     async def _list_users(self, endpoint, list_id, count, cursor):
         variables = {'listId': list_id, 'count': count}
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(endpoint, variables, FEATURES)
+        return await self.gql_get(endpoint, variables, FEATURES_JSON)
 
     async def list_members(self, list_id, count, cursor):
         return await self._list_users(Endpoint.LIST_MEMBERS, list_id, count, cursor)
@@ -592,11 +656,7 @@ class GQLClient:
 
     async def community_query(self, community_id):
         variables = {'communityId': community_id}
-        features = {
-            'c9s_list_members_action_api_enabled': False,
-            'c9s_superc9s_indication_enabled': False
-        }
-        return await self.gql_get(Endpoint.COMMUNITY_QUERY, variables, features)
+        return await self.gql_get(Endpoint.COMMUNITY_QUERY, variables, COMMUNITY_QUERY_FEATURES_JSON)
 
     async def community_media_timeline(self, community_id, count, cursor):
         variables = {
@@ -606,7 +666,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.COMMUNITY_MEDIA_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES)
+        return await self.gql_get(Endpoint.COMMUNITY_MEDIA_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES_JSON)
 
     async def community_tweets_timeline(self, community_id, ranking_mode, count, cursor):
         variables = {
@@ -617,7 +677,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.COMMUNITY_TWEETS_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES)
+        return await self.gql_get(Endpoint.COMMUNITY_TWEETS_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES_JSON)
 
     async def communities_main_page_timeline(self, count, cursor):
         variables = {
@@ -626,29 +686,28 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.COMMUNITIES_MAIN_PAGE_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES)
+        return await self.gql_get(Endpoint.COMMUNITIES_MAIN_PAGE_TIMELINE, variables, COMMUNITY_TWEETS_FEATURES_JSON)
 
     async def join_community(self, community_id):
         variables = {'communityId': community_id}
-        return await self.gql_post(Endpoint.JOIN_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES)
+        return await self.gql_post(Endpoint.JOIN_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES_JSON)
 
     async def leave_community(self, community_id):
         variables = {'communityId': community_id}
-        return await self.gql_post(Endpoint.LEAVE_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES)
+        return await self.gql_post(Endpoint.LEAVE_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES_JSON)
 
     async def request_to_join_community(self, community_id, answer):
         variables = {
             'communityId': community_id,
             'answer': '' if answer is None else answer
         }
-        return await self.gql_post(Endpoint.REQUEST_TO_JOIN_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES)
+        return await self.gql_post(Endpoint.REQUEST_TO_JOIN_COMMUNITY, variables, JOIN_COMMUNITY_FEATURES_JSON)
 
     async def _get_community_users(self, endpoint, community_id, count, cursor):
         variables = {'communityId': community_id, 'count': count}
-        features = {'responsive_web_graphql_timeline_navigation_enabled': True}
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(endpoint, variables, features)
+        return await self.gql_get(endpoint, variables, COMMUNITY_USERS_FEATURES_JSON)
 
     async def members_slice_timeline_query(self, community_id, count, cursor):
         return await self._get_community_users(Endpoint.MEMBERS_SLICE_TIMELINE_QUERY, community_id, count, cursor)
@@ -670,7 +729,7 @@ class GQLClient:
         }
         if cursor is not None:
             variables['cursor'] = cursor
-        return await self.gql_get(Endpoint.COMMUNITY_TWEET_SEARCH_MODULE_QUERY, variables, COMMUNITY_TWEETS_FEATURES)
+        return await self.gql_get(Endpoint.COMMUNITY_TWEET_SEARCH_MODULE_QUERY, variables, COMMUNITY_TWEETS_FEATURES_JSON)
 
     async def tweet_results_by_rest_ids(self, tweet_ids):
         variables = {
@@ -680,7 +739,7 @@ class GQLClient:
             'withVoice': True,
             'withCommunity': True
         }
-        return await self.gql_get(Endpoint.TWEET_RESULTS_BY_REST_IDS, variables, TWEET_RESULTS_BY_REST_IDS_FEATURES)
+        return await self.gql_get(Endpoint.TWEET_RESULTS_BY_REST_IDS, variables, TWEET_RESULTS_BY_REST_IDS_FEATURES_JSON)
 
     ####################
     # For guest client
@@ -701,5 +760,5 @@ class GQLClient:
             }
         }
         return await self.gql_get(
-            Endpoint.TWEET_RESULT_BY_REST_ID, variables, TWEET_RESULT_BY_REST_ID_FEATURES, extra_params=params
+            Endpoint.TWEET_RESULT_BY_REST_ID, variables, TWEET_RESULT_BY_REST_ID_FEATURES_JSON, extra_params=params
         )
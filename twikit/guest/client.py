@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import warnings
 from functools import partial
 from typing import Any, Literal
@@ -9,6 +8,7 @@ from urllib.parse import urlparse
 from httpx import AsyncClient, AsyncHTTPTransport, Response
 from httpx._utils import URLPattern
 
+from .. import _json
 from ..client.gql import GQLClient
 from ..client.v11 import V11Client
 from ..constants import DOMAIN, TOKEN
@@ -22,11 +22,22 @@ from ..errors import (
     TwitterException,
     Unauthorized
 )
-from ..utils import Result, find_dict, find_entry_by_type, httpx_transport_to_url
+from ..utils import (
+    DEFAULT_LIMITS,
+    Result,
+    find_dict,
+    find_entry_by_type,
+    httpx_transport_to_url
+)
 from ..x_client_transaction import ClientTransaction
 from .tweet import Tweet
 from .user import User
 
+# Names of the GQLClient methods behind each `tweet_type` of get_user_tweets.
+USER_TWEETS_FETCHERS = {
+    'Tweets': 'user_tweets'
+}
+
 
 def tweet_from_data(client: GuestClient, data: dict) -> Tweet:
     ':meta private:'
@@ -63,6 +74,9 @@ class GuestClient:
     proxy : :class:`str` | None, default=None
         The proxy server URL to use for request
         (e.g., 'http://0.0.0.0:0000').
+    http2 : :class:`bool`, default=False
+        Whether to use HTTP/2. Requires the `http2` extra
+        (``pip install twikit[http2]``).
 
     Examples
     --------
@@ -74,6 +88,7 @@ class GuestClient:
         self,
         language: str = 'en-US',
         proxy: str | None = None,
+        http2: bool = False,
         **kwargs
     ) -> None:
         if 'proxies' in kwargs:
@@ -83,9 +98,22 @@ class GuestClient:
             )
             warnings.warn(message)
 
-        self.http = AsyncClient(proxy=proxy, **kwargs)
+        # Connection options go to the transport built here, which is
+        # mounted for all requests (the same routing the proxy setter
+        # installs), so environment proxies are not used.
+        self._transport_options = {
+            'http2': http2,
+            'limits': kwargs.pop('limits', DEFAULT_LIMITS)
+        }
+        for key in ('verify', 'cert', 'http1'):
+            if key in kwargs:
+                self._transport_options[key] = kwargs.pop(key)
+        transport = AsyncHTTPTransport(proxy=proxy, **self._transport_options)
+        kwargs.setdefault('trust_env', False)
+        self.http = AsyncClient(
+            transport=transport, mounts={'all://': transport}, **kwargs
+        )
         self.language = language
-        self.proxy = proxy
 
         self._token = TOKEN
         self._user_agent = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -123,8 +151,8 @@ class GuestClient:
         response = await self.http.request(method, url, headers=headers, **kwargs)
 
         try:
-            response_data = response.json()
-        except json.decoder.JSONDecodeError:
+            response_data = _json.loads(response.content)
+        except _json.JSONDecodeError:
             response_data = response.text
 
         status_code = response.status_code
@@ -173,9 +201,17 @@ class GuestClient:
     @proxy.setter
     def proxy(self, url: str) -> None:
         self.http._mounts = {
-            URLPattern('all://'): AsyncHTTPTransport(proxy=url)
+            URLPattern('all://'): AsyncHTTPTransport(
+                proxy=url, **self._transport_options
+            )
         }
 
+    async def close(self) -> None:
+        """
+        Closes the HTTP client and releases its pooled connections.
+        """
+        await self.http.aclose()
+
     @property
     def _base_headers(self) -> dict[str, str]:
         """
@@ -299,9 +335,7 @@ class GuestClient:
         .get_user_by_screen_name
         """
         tweet_type = tweet_type.capitalize()
-        f = {
-            'Tweets': self.gql.user_tweets,
-        }[tweet_type]
+        f = getattr(self.gql, USER_TWEETS_FETCHERS[tweet_type])
         response, _ = await f(user_id, count, None)
         instructions_ = find_dict(response, 'instructions', True)
         if not instructions_:
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from .geo import Place
 from .media import MEDIA_TYPE, _media_from_data
 from .user import User
-from .utils import find_dict, timestamp_to_datetime
+from .utils import find_first, timestamp_to_datetime
 
 if TYPE_CHECKING:
     from httpx import Response
@@ -554,26 +554,43 @@ class Tweet:
         return not self == __value
 
 
-def tweet_from_data(client: Client, data: dict) -> Tweet:
+def _tweet_result_from_entry(data: dict) -> dict | None:
+    # Timeline entries keep the tweet under content.itemContent and
+    # module items under item.itemContent. Anything else is searched.
+    try:
+        content = data['content'] if 'content' in data else data['item']
+        return content['itemContent']['tweet_results']['result']
+    except (KeyError, TypeError):
+        return find_first(data, 'result')
+
+
+def tweet_from_data(
+    client: Client, data: dict, users: dict[str, User] | None = None
+) -> Tweet:
     ':meta private:'
-    tweet_data_ = find_dict(data, 'result', True)
-    if not tweet_data_:
+    # `users` caches User objects by id across one page of results,
+    # since timelines often contain several tweets by the same author.
+    tweet_data = _tweet_result_from_entry(data)
+    if tweet_data is None:
         return None
-    tweet_data = tweet_data_[0]
 
     if tweet_data.get('__typename') == 'TweetTombstone':
         return None
     if 'tweet' in tweet_data:
         tweet_data = tweet_data['tweet']
-    if 'core' not in tweet_data:
-        return None
-    if 'result' not in tweet_data['core']['user_results']:
-        return None
     if 'legacy' not in tweet_data:
         return None
+    try:
+        user_data = tweet_data['core']['user_results']['result']
+    except KeyError:
+        return None
 
-    user_data = tweet_data['core']['user_results']['result']
-    return Tweet(client, tweet_data, User(client, user_data))
+    if users is None:
+        return Tweet(client, tweet_data, User(client, user_data))
+    user = users.get(user_data['rest_id'])
+    if user is None:
+        user = users[user_data['rest_id']] = User(client, user_data)
+    return Tweet(client, tweet_data, user)
 
 
 class ScheduledTweet:
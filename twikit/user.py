@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
-from .utils import timestamp_to_datetime
+from .utils import find_first, timestamp_to_datetime
 
 if TYPE_CHECKING:
     from httpx import Response
@@ -519,3 +519,12 @@ class User:
 
     def __ne__(self, __value: object) -> bool:
         return not self == __value
+
+
+def _user_result_from_entry(data: dict) -> dict | None:
+    # Timeline entries keep the user under content.itemContent.
+    # Anything else is searched.
+    try:
+        return data['content']['itemContent']['user_results']['result']
+    except (KeyError, TypeError):
+        return find_first(data, 'result')
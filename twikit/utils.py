@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
 from datetime import datetime
-from httpx import AsyncHTTPTransport
+from functools import lru_cache
+from httpx import AsyncHTTPTransport, Limits
+from . import _json
 from typing import TYPE_CHECKING, Any, Awaitable, Generic, Iterator, Literal, TypedDict, TypeVar
 
 if TYPE_CHECKING:
@@ -11,6 +13,14 @@ if TYPE_CHECKING:
 
 T = TypeVar('T')
 
+# Connection pool sized so that paginated requests reuse
+# kept-alive connections instead of opening new ones.
+DEFAULT_LIMITS = Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=30.0
+)
+
 
 class Result(Generic[T]):
     """
@@ -44,11 +54,34 @@ class Result(Generic[T]):
         self.__fetch_next_result = fetch_next_result
         self.previous_cursor = previous_cursor
         self.__fetch_previous_result = fetch_previous_result
+        self.__next_task: asyncio.Task | None = None
+
+    def prefetch(self) -> asyncio.Future | None:
+        """
+        Starts fetching the next result in the background, so that
+        a following call to `next` does not wait for the round trip.
+        The task is returned so that it can be awaited or cancelled,
+        or None if there is no next result.
+
+        Examples
+        --------
+        >>> tweets = await client.search_tweet('query', 'Latest')
+        >>> tweets.prefetch()
+        >>> for tweet in tweets:
+        ...     process(tweet)
+        >>> more_tweets = await tweets.next()  # Already fetched
+        """
+        if self.__fetch_next_result is not None and self.__next_task is None:
+            self.__next_task = asyncio.ensure_future(self.__fetch_next_result())
+        return self.__next_task
 
     async def next(self) -> Result[T]:
         """
         The next result.
         """
+        if self.__next_task is not None:
+            task, self.__next_task = self.__next_task, None
+            return await task
         if self.__fetch_next_result is None:
             return Result([])
         return await self.__fetch_next_result()
@@ -108,25 +141,90 @@ class Flow:
         return self.response['subtasks'][0]['subtask_id']
 
 
+_MISSING = object()
+
+
+def find_first(obj: list | dict, key: str | int, default: Any = None) -> Any:
+    """
+    Retrieves the first element stored under `key` in a nested dictionary.
+    Elements are visited in the same order as :func:`find_dict`.
+    """
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if key in current:
+                return current[key]
+            stack.extend(reversed(current.values()))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+    return default
+
+
 def find_dict(obj: list | dict, key: str | int, find_one: bool = False) -> list[Any]:
     """
     Retrieves elements from a nested dictionary.
     """
+    if find_one:
+        value = find_first(obj, key, _MISSING)
+        return [] if value is _MISSING else [value]
     results = []
-    if isinstance(obj, dict):
-        if key in obj:
-            results.append(obj.get(key))
-            if find_one:
-                return results
-    if isinstance(obj, (list, dict)):
-        for elem in (obj if isinstance(obj, list) else obj.values()):
-            r = find_dict(elem, key, find_one)
-            results += r
-            if r and find_one:
-                return results
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if key in current:
+                results.append(current[key])
+            stack.extend(reversed(current.values()))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
     return results
 
 
+# Location of the timeline instructions under the root field of each
+# GraphQL timeline query, e.g. data.retweeters_timeline.timeline.instructions.
+TIMELINE_INSTRUCTIONS_PATHS = {
+    'search_by_raw_query': ('search_timeline', 'timeline', 'instructions'),
+    'threaded_conversation_with_injections_v2': ('instructions',),
+    'retweeters_timeline': ('timeline', 'instructions'),
+    'favoriters_timeline': ('timeline', 'instructions'),
+    'home': ('home_timeline_urt', 'instructions'),
+    'bookmark_timeline_v2': ('timeline', 'instructions'),
+    'bookmark_collection_timeline': ('timeline', 'instructions'),
+    'user': ('result', 'timeline', 'timeline', 'instructions'),
+}
+
+
+def find_entries(response: dict, default: Any = _MISSING) -> Any:
+    """
+    Retrieves the first `entries` list of a timeline response.
+    Responses of the queries in `TIMELINE_INSTRUCTIONS_PATHS` are read
+    by indexing their instructions directly, and any other response is
+    searched with :func:`find_first`. Raises :exc:`KeyError` if the
+    response has no entries and no `default` is given.
+    """
+    data = response.get('data')
+    if isinstance(data, dict):
+        for field, node in data.items():
+            path = TIMELINE_INSTRUCTIONS_PATHS.get(field)
+            if path is None:
+                continue
+            try:
+                for key in path:
+                    node = node[key]
+            except (KeyError, TypeError):
+                break
+            if isinstance(node, list):
+                for instruction in node:
+                    if 'entries' in instruction:
+                        return instruction['entries']
+            break
+    entries = find_first(response, 'entries', default)
+    if entries is _MISSING:
+        raise KeyError('entries')
+    return entries
+
+
 def httpx_transport_to_url(transport: AsyncHTTPTransport) -> str:
     url = transport._pool._proxy_url
     scheme = url.scheme.decode()
@@ -146,6 +244,7 @@ def httpx_transport_to_url(transport: AsyncHTTPTransport) -> str:
     return url_str
 
 
+@lru_cache(maxsize=None)
 def get_query_id(url: str) -> str:
     """
     Extracts the identifier from a URL.
@@ -231,7 +330,7 @@ def flatten_params(params: dict) -> dict:
     flattened_params = {}
     for key, value in params.items():
         if isinstance(value, (list, dict)):
-            value = json.dumps(value)
+            value = _json.dumps(value)
         flattened_params[key] = value
     return flattened_params
 